@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import string
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 import httpx
+import idna
+from pydantic import BaseModel
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup (``rdapapi[fast]``)
+    from json import loads as _json_loads
 
 from ._version import __version__
 from .exceptions import (
@@ -31,8 +44,18 @@ from .models import (
 
 _DEFAULT_BASE_URL = "https://rdapapi.io/api/v1"
 _DEFAULT_TIMEOUT = 30
+_DEFAULT_CACHE_SIZE = 256
+_DEFAULT_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30)
 _USER_AGENT = f"rdapapi-python/{__version__}"
 
+_DOMAIN_PATH = "/domain/"
+_IP_PATH = "/ip/"
+_ASN_PATH = "/asn/"
+_NAMESERVER_PATH = "/nameserver/"
+_ENTITY_PATH = "/entity/"
+_FOLLOW_QUERY = "?follow=true"
+_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+
 _ERROR_MAP: Dict[int, type] = {
     400: ValidationError,
     401: AuthenticationError,
@@ -45,38 +68,112 @@ _ERROR_MAP: Dict[int, type] = {
 
 
 def _raise_for_status(response: httpx.Response) -> None:
-    """Raise a typed exception for error responses."""
-    if response.status_code >= 400:
-        try:
-            body = response.json()
-        except Exception:
-            body = {}
-
-        error = body.get("error", "unknown_error")
-        message = body.get("message", f"HTTP {response.status_code}")
-        exc_class = _ERROR_MAP.get(response.status_code, RdapApiError)
-
-        if exc_class is NotFoundError and error == "not_supported":
-            exc_class = NotSupportedError
-
-        kwargs: Dict[str, Any] = {
-            "status_code": response.status_code,
-            "error": error,
-        }
+    """Raise a typed exception for an error response (status code >= 400)."""
+    status_code = response.status_code
+    try:
+        body = _json_loads(response.content)
+    except Exception:
+        body = {}
+    if not isinstance(body, dict):
+        body = {}
+
+    error = body.get("error", "unknown_error")
+    message = body.get("message", f"HTTP {status_code}")
+    exc_class = _ERROR_MAP.get(status_code, RdapApiError)
+
+    if exc_class is NotFoundError and error == "not_supported":
+        exc_class = NotSupportedError
+
+    if exc_class is RateLimitError or exc_class is TemporarilyUnavailableError:
+        retry_after = response.headers.get("Retry-After")
+        raise exc_class(
+            message,
+            status_code=status_code,
+            error=error,
+            retry_after=int(retry_after) if retry_after else None,
+        )
+
+    raise exc_class(message, status_code=status_code, error=error)
+
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def _seconds_until(timestamp: str) -> Optional[float]:
+    """Seconds from now until an ISO-8601 ``timestamp``, or ``None`` if it cannot be parsed."""
+    try:
+        expires = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        return (expires - datetime.now(timezone.utc)).total_seconds()
+    except (ValueError, TypeError, AttributeError):
+        return None
 
-        if exc_class in (RateLimitError, TemporarilyUnavailableError):
-            retry_after = response.headers.get("Retry-After")
-            kwargs["retry_after"] = int(retry_after) if retry_after else None
 
-        raise exc_class(message, **kwargs)
+class _ResponseCache:
+    """LRU cache of lookup responses, each kept until its ``meta.cache_expires``.
 
+    A client may be shared across threads (see :meth:`RdapApi.default`), so every
+    access to the entries holds a lock.
+    """
 
-def _parse_bulk_response(data: dict) -> BulkDomainResponse:
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        ttl = _seconds_until(value.meta.cache_expires)
+        if ttl is None or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+def _parse_bulk_response(data: bytes) -> BulkDomainResponse:
     """Parse a bulk domain response, merging meta into each successful result's data."""
-    for result in data.get("results", []):
+    payload = _json_loads(data)
+    for result in payload.get("results", []):
         if result.get("status") == "success" and "data" in result and "meta" in result:
             result["data"]["meta"] = result.pop("meta")
-    return BulkDomainResponse.model_validate(data)
+    return BulkDomainResponse.model_validate(payload)
+
+
+def _encode_domain(name: str) -> str:
+    """Return ``name`` in its ASCII (IDNA) form, raising :class:`ValidationError` if it is malformed."""
+    if name.isascii():
+        labels = name[:-1].split(".") if name.endswith(".") else name.split(".")
+        if _DOMAIN_CHARS.issuperset(name) and "" not in labels:
+            return name
+        raise ValidationError(f"Invalid domain name: {name!r}", error="invalid_domain")
+    try:
+        return idna.encode(name, uts46=True).decode("ascii")
+    except idna.IDNAError as exc:
+        raise ValidationError(f"Invalid domain name: {name!r} ({exc})", error="invalid_domain") from exc
+
+
+def _build_headers(api_key: str) -> httpx.Headers:
+    """Default headers shared by both clients; httpx merges them into every request."""
+    return httpx.Headers(
+        {
+            "Authorization": f"Bearer {api_key}",
+            "User-Agent": _USER_AGENT,
+            "Accept": "application/json",
+        }
+    )
 
 
 def _tlds_params(*, since: Optional[str], server: Optional[str]) -> Optional[Dict[str, str]]:
@@ -88,6 +185,10 @@ def _tlds_params(*, since: Optional[str], server: Optional[str]) -> Optional[Dic
     return params or None
 
 
+_SHARED: Dict[Tuple[str, str], RdapApi] = {}
+_SHARED_LOCK = threading.Lock()
+
+
 class RdapApi:
     """Synchronous client for the RDAP API.
 
@@ -100,42 +201,74 @@ class RdapApi:
         print(domain.registrar.name)
     """
 
+    @classmethod
+    def default(cls, api_key: str, *, base_url: str = _DEFAULT_BASE_URL) -> RdapApi:
+        """Return a process-wide client shared by all callers with the same key and base URL.
+
+        Creating a client per call (for example inside a web request handler)
+        pays a new TCP and TLS handshake each time; the shared client keeps its
+        connections open between calls. A new client is created if the shared
+        one has been closed.
+        """
+        key = (api_key, base_url)
+        with _SHARED_LOCK:
+            api = _SHARED.get(key)
+            if api is None or api._client.is_closed:
+                api = _SHARED[key] = cls(api_key, base_url=base_url)
+            return api
+
     def __init__(
         self,
         api_key: str,
         *,
         base_url: str = _DEFAULT_BASE_URL,
         timeout: int = _DEFAULT_TIMEOUT,
+        http2: bool = True,
+        cache: bool = True,
+        cache_size: int = _DEFAULT_CACHE_SIZE,
+        transport: Optional[httpx.BaseTransport] = None,
     ) -> None:
         if not api_key:
             raise ValueError("api_key must be a non-empty string")
+        self._api_key = api_key
+        self._base_url = base_url
+        self._timeout = timeout
         self._client = httpx.Client(
             base_url=base_url,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "User-Agent": _USER_AGENT,
-                "Accept": "application/json",
-            },
+            headers=_build_headers(api_key),
             timeout=timeout,
+            limits=_DEFAULT_LIMITS,
+            http2=http2,
+            transport=transport,
         )
-
-    def _request(
-        self,
-        path: str,
-        params: Optional[Dict[str, str]] = None,
-    ) -> dict:
-        response = self._client.get(path, params=params)
-        _raise_for_status(response)
-        return response.json()
+        self._cache = _ResponseCache(cache_size) if cache else None
+
+    def _request(self, path: str) -> bytes:
+        response = self._client.get(path)
+        if response.status_code >= 400:
+            _raise_for_status(response)
+        return response.content
+
+    def _lookup(self, model: Type[_M], path: str) -> _M:
+        if self._cache is not None:
+            cached = self._cache.get(path)
+            if cached is not None:
+                return cached
+        data = self._request(path)
+        result = model.model_validate_json(data)
+        if self._cache is not None:
+            self._cache.set(path, result)
+        return result
 
     def _post(
         self,
         path: str,
         body: Dict[str, Any],
-    ) -> dict:
+    ) -> bytes:
         response = self._client.post(path, json=body)
-        _raise_for_status(response)
-        return response.json()
+        if response.status_code >= 400:
+            _raise_for_status(response)
+        return response.content
 
     def _conditional_get(
         self,
@@ -148,40 +281,42 @@ class RdapApi:
         response = self._client.get(path, params=params, headers=headers)
         if response.status_code == 304:
             return None
-        _raise_for_status(response)
-        payload = response.json()
+        if response.status_code >= 400:
+            _raise_for_status(response)
+        payload = _json_loads(response.content)
         payload["etag"] = response.headers.get("ETag")
         return payload
 
     def domain(self, name: str, *, follow: bool = False) -> DomainResponse:
-        """Look up RDAP registration data for a domain name."""
-        params = {"follow": "true"} if follow else None
-        data = self._request(f"/domain/{name}", params=params)
-        return DomainResponse.model_validate(data)
+        """Look up RDAP registration data for a domain name.
+
+        Internationalized names are IDNA-encoded before the request; malformed
+        names raise :class:`ValidationError` without contacting the API.
+        """
+        path = _DOMAIN_PATH + _encode_domain(name)
+        if follow:
+            path += _FOLLOW_QUERY
+        return self._lookup(DomainResponse, path)
 
     def ip(self, address: str) -> IpResponse:
         """Look up RDAP registration data for an IP address."""
-        data = self._request(f"/ip/{address}")
-        return IpResponse.model_validate(data)
+        return self._lookup(IpResponse, _IP_PATH + address)
 
     def asn(self, number: Union[int, str]) -> AsnResponse:
         """Look up RDAP registration data for an ASN.
 
         Accepts an integer (15169) or string ("AS15169" or "15169").
         """
-        value = str(number).upper().removeprefix("AS")
-        data = self._request(f"/asn/{value}")
-        return AsnResponse.model_validate(data)
+        value = str(number) if isinstance(number, int) else number.upper().removeprefix("AS")
+        return self._lookup(AsnResponse, _ASN_PATH + value)
 
     def nameserver(self, host: str) -> NameserverResponse:
         """Look up RDAP registration data for a nameserver."""
-        data = self._request(f"/nameserver/{host}")
-        return NameserverResponse.model_validate(data)
+        return self._lookup(NameserverResponse, _NAMESERVER_PATH + host)
 
     def entity(self, handle: str) -> EntityResponse:
         """Look up RDAP registration data for an entity by handle."""
-        data = self._request(f"/entity/{handle}")
-        return EntityResponse.model_validate(data)
+        return self._lookup(EntityResponse, _ENTITY_PATH + handle)
 
     def bulk_domains(
         self,
@@ -200,6 +335,54 @@ class RdapApi:
         data = self._post("/domains/bulk", body)
         return _parse_bulk_response(data)
 
+    def bulk_domain_lookup(
+        self,
+        names: List[str],
+        *,
+        follow: bool = False,
+        concurrency: int = 20,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> List[Optional[DomainResponse]]:
+        """Look up many domains concurrently, returning results in input order.
+
+        Runs up to ``concurrency`` individual :meth:`domain` lookups at once over
+        a single HTTP/2 connection. Domains that are not found, and malformed
+        names rejected before any request is sent, are returned as ``None``; any
+        other error is raised. Must not be called from a running event loop — use
+        :class:`AsyncRdapApi` there instead.
+
+        The lookups run on a temporary :class:`AsyncRdapApi` with this client's
+        key, base URL, and timeout. It does not use the ``transport`` given to
+        this client; pass ``async_transport`` to route it through a custom one.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        async def run() -> List[Optional[DomainResponse]]:
+            semaphore = asyncio.Semaphore(concurrency)
+            async with AsyncRdapApi(
+                self._api_key,
+                base_url=self._base_url,
+                timeout=self._timeout,
+                http2=True,
+                transport=async_transport,
+            ) as api:
+
+                async def one(name: str) -> Optional[DomainResponse]:
+                    async with semaphore:
+                        try:
+                            return await api.domain(name, follow=follow)
+                        except NotFoundError:
+                            return None
+                        except ValidationError as exc:
+                            if exc.status_code is not None:  # rejected by the API, not locally
+                                raise
+                            return None
+
+                return await asyncio.gather(*(one(name) for name in names))
+
+        return asyncio.run(run())
+
     def tlds(
         self,
         *,
@@ -262,36 +445,49 @@ class AsyncRdapApi:
         *,
         base_url: str = _DEFAULT_BASE_URL,
         timeout: int = _DEFAULT_TIMEOUT,
+        http2: bool = True,
+        cache: bool = True,
+        cache_size: int = _DEFAULT_CACHE_SIZE,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ) -> None:
         if not api_key:
             raise ValueError("api_key must be a non-empty string")
         self._client = httpx.AsyncClient(
             base_url=base_url,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "User-Agent": _USER_AGENT,
-                "Accept": "application/json",
-            },
+            headers=_build_headers(api_key),
             timeout=timeout,
+            limits=_DEFAULT_LIMITS,
+            http2=http2,
+            transport=transport,
         )
-
-    async def _request(
-        self,
-        path: str,
-        params: Optional[Dict[str, str]] = None,
-    ) -> dict:
-        response = await self._client.get(path, params=params)
-        _raise_for_status(response)
-        return response.json()
+        self._cache = _ResponseCache(cache_size) if cache else None
+
+    async def _request(self, path: str) -> bytes:
+        response = await self._client.get(path)
+        if response.status_code >= 400:
+            _raise_for_status(response)
+        return response.content
+
+    async def _lookup(self, model: Type[_M], path: str) -> _M:
+        if self._cache is not None:
+            cached = self._cache.get(path)
+            if cached is not None:
+                return cached
+        data = await self._request(path)
+        result = model.model_validate_json(data)
+        if self._cache is not None:
+            self._cache.set(path, result)
+        return result
 
     async def _post(
         self,
         path: str,
         body: Dict[str, Any],
-    ) -> dict:
+    ) -> bytes:
         response = await self._client.post(path, json=body)
-        _raise_for_status(response)
-        return response.json()
+        if response.status_code >= 400:
+            _raise_for_status(response)
+        return response.content
 
     async def _conditional_get(
         self,
@@ -304,40 +500,42 @@ class AsyncRdapApi:
         response = await self._client.get(path, params=params, headers=headers)
         if response.status_code == 304:
             return None
-        _raise_for_status(response)
-        payload = response.json()
+        if response.status_code >= 400:
+            _raise_for_status(response)
+        payload = _json_loads(response.content)
         payload["etag"] = response.headers.get("ETag")
         return payload
 
     async def domain(self, name: str, *, follow: bool = False) -> DomainResponse:
-        """Look up RDAP registration data for a domain name."""
-        params = {"follow": "true"} if follow else None
-        data = await self._request(f"/domain/{name}", params=params)
-        return DomainResponse.model_validate(data)
+        """Look up RDAP registration data for a domain name.
+
+        Internationalized names are IDNA-encoded before the request; malformed
+        names raise :class:`ValidationError` without contacting the API.
+        """
+        path = _DOMAIN_PATH + _encode_domain(name)
+        if follow:
+            path += _FOLLOW_QUERY
+        return await self._lookup(DomainResponse, path)
 
     async def ip(self, address: str) -> IpResponse:
         """Look up RDAP registration data for an IP address."""
-        data = await self._request(f"/ip/{address}")
-        return IpResponse.model_validate(data)
+        return await self._lookup(IpResponse, _IP_PATH + address)
 
     async def asn(self, number: Union[int, str]) -> AsnResponse:
         """Look up RDAP registration data for an ASN.
 
         Accepts an integer (15169) or string ("AS15169" or "15169").
         """
-        value = str(number).upper().removeprefix("AS")
-        data = await self._request(f"/asn/{value}")
-        return AsnResponse.model_validate(data)
+        value = str(number) if isinstance(number, int) else number.upper().removeprefix("AS")
+        return await self._lookup(AsnResponse, _ASN_PATH + value)
 
     async def nameserver(self, host: str) -> NameserverResponse:
         """Look up RDAP registration data for a nameserver."""
-        data = await self._request(f"/nameserver/{host}")
-        return NameserverResponse.model_validate(data)
+        return await self._lookup(NameserverResponse, _NAMESERVER_PATH + host)
 
     async def entity(self, handle: str) -> EntityResponse:
         """Look up RDAP registration data for an entity by handle."""
-        data = await self._request(f"/entity/{handle}")
-        return EntityResponse.model_validate(data)
+        return await self._lookup(EntityResponse, _ENTITY_PATH + handle)
 
     async def bulk_domains(
         self,
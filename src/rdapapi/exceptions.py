@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 __all__ = [
     "RdapApiError",
     "AuthenticationError",
@@ -18,6 +20,8 @@ __all__ = [
 class RdapApiError(Exception):
     """Base exception for all RDAP API errors."""
 
+    __slots__ = ("status_code", "error", "message")
+
     def __init__(
         self,
         message: str,
@@ -30,6 +34,14 @@ class RdapApiError(Exception):
         self.error = error
         self.message = message
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slot attributes are not part of BaseException's default pickle state.
+        state = dict(self.__dict__)
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                state[name] = getattr(self, name)
+        return type(self), self.args, state
+
 
 class AuthenticationError(RdapApiError):
     """Raised when the API key is missing or invalid (HTTP 401)."""
@@ -63,6 +75,8 @@ class ValidationError(RdapApiError):
 class RateLimitError(RdapApiError):
     """Raised when rate limit or monthly quota is exceeded (HTTP 429)."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str,
@@ -78,6 +92,8 @@ class RateLimitError(RdapApiError):
 class TemporarilyUnavailableError(RdapApiError):
     """Raised when the domain data is temporarily unavailable (HTTP 503)."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str,
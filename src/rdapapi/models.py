@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
-from typing import List, Optional
+from functools import cached_property
+from typing import Any, List, Mapping, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 __all__ = [
     "AsnResponse",
@@ -36,7 +38,13 @@ __all__ = [
 ]
 
 
-class Meta(BaseModel):
+class _Model(BaseModel):
+    """Base for all response models, which are immutable once built."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class Meta(_Model):
     """Metadata about the RDAP lookup."""
 
     rdap_server: str
@@ -48,7 +56,18 @@ class Meta(BaseModel):
     follow_error: Optional[str] = None
 
 
-class Dates(BaseModel):
+# Only the forms every supported Python's fromisoformat accepts, so results don't depend on the version:
+# extended format, and fractional seconds of exactly 3 or 6 digits.
+_ISO_DATETIME = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+    r"(?:[T ][0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{3}(?:[0-9]{3})?)?)?(?:Z|[+-][0-9]{2}:[0-9]{2})?)?\Z"
+)
+
+# The cached properties holding the parsed ``Dates`` strings.
+_PARSED_DATES = ("registered_at", "expires_at", "updated_at")
+
+
+class Dates(_Model):
     """Registration dates."""
 
     registered: Optional[str] = None
@@ -57,24 +76,41 @@ class Dates(BaseModel):
 
     @staticmethod
     def _parse(value: Optional[str]) -> Optional[datetime]:
-        if value is None:
+        if not isinstance(value, str):
+            return None
+        if (
+            len(value) == 20
+            and value[19] == "Z"
+            and value[4] == value[7] == "-"
+            and value[10] == "T"
+            and value[13] == value[16] == ":"
+        ):
+            # ``YYYY-MM-DDTHH:MM:SSZ``, the form most registries send. With the separators pinned,
+            # fromisoformat only has digits left to check, on every Python version.
+            value = value[:19] + "+00:00"
+        elif _ISO_DATETIME.match(value) is not None:
+            value = value.replace("Z", "+00:00")
+        else:
+            # Reject anything that is not shaped like an ISO 8601 date up front instead of raising and catching.
             return None
         try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except (ValueError, TypeError):
+            parsed = datetime.fromisoformat(value)
+        except ValueError:  # well-formed but out of range, e.g. month 13
             return None
+        # RDAP times are UTC unless they carry an offset; never hand back a naive datetime.
+        return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
 
-    @property
+    @cached_property
     def registered_at(self) -> Optional[datetime]:
         """Parse ``registered`` into a timezone-aware :class:`~datetime.datetime`."""
         return self._parse(self.registered)
 
-    @property
+    @cached_property
     def expires_at(self) -> Optional[datetime]:
         """Parse ``expires`` into a timezone-aware :class:`~datetime.datetime`."""
         return self._parse(self.expires)
 
-    @property
+    @cached_property
     def updated_at(self) -> Optional[datetime]:
         """Parse ``updated`` into a timezone-aware :class:`~datetime.datetime`."""
         return self._parse(self.updated)
@@ -87,8 +123,15 @@ class Dates(BaseModel):
             return None
         return (dt - datetime.now(timezone.utc)).days
 
+    # The parsed datetimes are cached in ``__dict__``; drop them so a copy with updated strings re-parses.
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> Dates:
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _PARSED_DATES:
+            copied.__dict__.pop(name, None)
+        return copied
+
 
-class Registrar(BaseModel):
+class Registrar(_Model):
     """Domain registrar information."""
 
     name: Optional[str] = None
@@ -98,7 +141,7 @@ class Registrar(BaseModel):
     url: Optional[str] = None
 
 
-class Contact(BaseModel):
+class Contact(_Model):
     """Contact entity information."""
 
     handle: Optional[str] = None
@@ -111,7 +154,7 @@ class Contact(BaseModel):
     country_code: Optional[str] = None
 
 
-class Entities(BaseModel):
+class Entities(_Model):
     """Contact entities keyed by role."""
 
     registrant: Optional[Contact] = None
@@ -121,14 +164,14 @@ class Entities(BaseModel):
     abuse: Optional[Contact] = None
 
 
-class Remark(BaseModel):
+class Remark(_Model):
     """Remark from the registry."""
 
     title: Optional[str] = None
     description: str
 
 
-class DomainResponse(BaseModel):
+class DomainResponse(_Model):
     """Response from a domain lookup."""
 
     domain: str
@@ -143,14 +186,14 @@ class DomainResponse(BaseModel):
     meta: Meta
 
 
-class IpAddresses(BaseModel):
+class IpAddresses(_Model):
     """IP addresses for a nameserver."""
 
     v4: List[str] = Field(default_factory=list)
     v6: List[str] = Field(default_factory=list)
 
 
-class IpResponse(BaseModel):
+class IpResponse(_Model):
     """Response from an IP address lookup."""
 
     handle: Optional[str] = None
@@ -170,7 +213,7 @@ class IpResponse(BaseModel):
     meta: Meta
 
 
-class AsnResponse(BaseModel):
+class AsnResponse(_Model):
     """Response from an ASN lookup."""
 
     handle: Optional[str] = None
@@ -186,7 +229,7 @@ class AsnResponse(BaseModel):
     meta: Meta
 
 
-class NameserverResponse(BaseModel):
+class NameserverResponse(_Model):
     """Response from a nameserver lookup."""
 
     ldh_name: str
@@ -199,14 +242,14 @@ class NameserverResponse(BaseModel):
     meta: Meta
 
 
-class PublicId(BaseModel):
+class PublicId(_Model):
     """Public identifier (e.g. ARIN OrgID, IANA Registrar ID)."""
 
     type: Optional[str] = None
     identifier: Optional[str] = None
 
 
-class EntityAutnum(BaseModel):
+class EntityAutnum(_Model):
     """Autonomous system number owned by an entity."""
 
     handle: Optional[str] = None
@@ -215,7 +258,7 @@ class EntityAutnum(BaseModel):
     end_autnum: Optional[int] = None
 
 
-class EntityNetwork(BaseModel):
+class EntityNetwork(_Model):
     """IP network block owned by an entity."""
 
     handle: Optional[str] = None
@@ -226,7 +269,7 @@ class EntityNetwork(BaseModel):
     cidr: List[str] = Field(default_factory=list)
 
 
-class BulkDomainResult(BaseModel):
+class BulkDomainResult(_Model):
     """A single result within a bulk domain lookup response.
 
     When ``status`` is ``"success"``, ``data`` contains a full
@@ -241,7 +284,7 @@ class BulkDomainResult(BaseModel):
     message: Optional[str] = None
 
 
-class BulkDomainSummary(BaseModel):
+class BulkDomainSummary(_Model):
     """Summary counts for a bulk domain lookup."""
 
     total: int
@@ -249,14 +292,14 @@ class BulkDomainSummary(BaseModel):
     failed: int
 
 
-class BulkDomainResponse(BaseModel):
+class BulkDomainResponse(_Model):
     """Response from a bulk domain lookup."""
 
     results: List[BulkDomainResult]
     summary: BulkDomainSummary
 
 
-class FieldAvailability(BaseModel):
+class FieldAvailability(_Model):
     """How often each common domain field is populated in a TLD's RDAP responses.
 
     Each value is one of ``"always"``, ``"usually"``, ``"sometimes"``, or
@@ -270,7 +313,7 @@ class FieldAvailability(BaseModel):
     status: str
 
 
-class TldEntry(BaseModel):
+class TldEntry(_Model):
     """A single TLD entry from the ``/tlds`` catalog."""
 
     tld: str
@@ -280,7 +323,7 @@ class TldEntry(BaseModel):
     field_availability: Optional[FieldAvailability] = None
 
 
-class TldThresholds(BaseModel):
+class TldThresholds(_Model):
     """Percentage cutoffs used to pick each availability label."""
 
     always: float
@@ -288,7 +331,7 @@ class TldThresholds(BaseModel):
     sometimes: float
 
 
-class TldListMeta(BaseModel):
+class TldListMeta(_Model):
     """Metadata for a TLD list response."""
 
     computed_at: str
@@ -297,14 +340,14 @@ class TldListMeta(BaseModel):
     thresholds: TldThresholds
 
 
-class TldMeta(BaseModel):
+class TldMeta(_Model):
     """Metadata for a single-TLD response."""
 
     computed_at: str
     thresholds: TldThresholds
 
 
-class TldListResponse(BaseModel):
+class TldListResponse(_Model):
     """Response from ``GET /tlds``."""
 
     data: List[TldEntry]
@@ -312,7 +355,7 @@ class TldListResponse(BaseModel):
     etag: Optional[str] = None
 
 
-class TldResponse(BaseModel):
+class TldResponse(_Model):
     """Response from ``GET /tlds/{tld}``."""
 
     data: TldEntry
@@ -320,7 +363,7 @@ class TldResponse(BaseModel):
     etag: Optional[str] = None
 
 
-class EntityResponse(BaseModel):
+class EntityResponse(_Model):
     """Response from an entity lookup."""
 
     handle: Optional[str] = None
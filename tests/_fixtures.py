@@ -0,0 +1,234 @@
+"""Canned API responses shared by the client test suites.
+
+The responses live in ``fixtures.json``, which is parsed once per process.
+Each response is also serialized once to JSON bytes, and wrapped once in a
+stream, so mocks can return it without re-encoding or copying on every call.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import orjson
+import pytest
+
+from rdapapi import (
+    AuthenticationError,
+    NotFoundError,
+    NotSupportedError,
+    RateLimitError,
+    SubscriptionRequiredError,
+    TemporarilyUnavailableError,
+    UpstreamError,
+    ValidationError,
+)
+
+BASE_URL = "https://rdapapi.io/api/v1"
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@lru_cache(maxsize=1)
+def _responses() -> Dict[str, Any]:
+    return orjson.loads(Path(__file__).with_name("fixtures.json").read_bytes())
+
+
+DOMAIN_RESPONSE = _responses()["domain"]
+IP_RESPONSE = _responses()["ip"]
+ASN_RESPONSE = _responses()["asn"]
+NS_RESPONSE = _responses()["nameserver"]
+ENTITY_RESPONSE = _responses()["entity"]
+BULK_RESPONSE = _responses()["bulk"]
+TLDS_RESPONSE = _responses()["tlds"]
+TLD_RESPONSE = _responses()["tld"]
+
+DOMAIN_BYTES = orjson.dumps(DOMAIN_RESPONSE)
+IP_BYTES = orjson.dumps(IP_RESPONSE)
+ASN_BYTES = orjson.dumps(ASN_RESPONSE)
+NS_BYTES = orjson.dumps(NS_RESPONSE)
+ENTITY_BYTES = orjson.dumps(ENTITY_RESPONSE)
+BULK_BYTES = orjson.dumps(BULK_RESPONSE)
+TLDS_BYTES = orjson.dumps(TLDS_RESPONSE)
+TLD_BYTES = orjson.dumps(TLD_RESPONSE)
+
+# Reusable response bodies: an in-memory ByteStream can be iterated any number of times.
+DOMAIN_STREAM = httpx.ByteStream(DOMAIN_BYTES)
+IP_STREAM = httpx.ByteStream(IP_BYTES)
+ASN_STREAM = httpx.ByteStream(ASN_BYTES)
+NS_STREAM = httpx.ByteStream(NS_BYTES)
+ENTITY_STREAM = httpx.ByteStream(ENTITY_BYTES)
+BULK_STREAM = httpx.ByteStream(BULK_BYTES)
+TLDS_STREAM = httpx.ByteStream(TLDS_BYTES)
+TLD_STREAM = httpx.ByteStream(TLD_BYTES)
+
+
+def resolve(obj: Any, path: str) -> Any:
+    """Follow a dotted attribute path such as ``"registrar.name"`` or ``"autnums.0.handle"``."""
+    for part in path.split("."):
+        obj = obj[int(part)] if part.isdigit() else getattr(obj, part)
+    return obj
+
+
+def _json_route(
+    status: int, body: Any, headers: Optional[Dict[str, str]] = None
+) -> Tuple[int, httpx.ByteStream, Dict[str, str]]:
+    return status, httpx.ByteStream(orjson.dumps(body)), {**JSON_HEADERS, **(headers or {})}
+
+
+API_PATH = httpx.URL(BASE_URL).path
+
+# Canned responses served by ``dispatch``: request path -> (status, body stream, headers).
+ROUTES = {
+    f"{API_PATH}/domain/google.com": (200, DOMAIN_STREAM, JSON_HEADERS),
+    f"{API_PATH}/ip/8.8.8.8": (200, IP_STREAM, JSON_HEADERS),
+    f"{API_PATH}/asn/15169": (200, ASN_STREAM, JSON_HEADERS),
+    f"{API_PATH}/nameserver/ns1.google.com": (200, NS_STREAM, JSON_HEADERS),
+    f"{API_PATH}/entity/GOGL": (200, ENTITY_STREAM, JSON_HEADERS),
+    f"{API_PATH}/domains/bulk": (200, BULK_STREAM, JSON_HEADERS),
+    f"{API_PATH}/tlds": (200, TLDS_STREAM, {**JSON_HEADERS, "ETag": '"abc"'}),
+    f"{API_PATH}/tlds/com": (200, TLD_STREAM, {**JSON_HEADERS, "ETag": '"com-1"'}),
+    f"{API_PATH}/domain/unauthenticated.test": _json_route(
+        401, {"error": "unauthenticated", "message": "Invalid or missing API token."}
+    ),
+    f"{API_PATH}/domain/subscription-required.test": _json_route(
+        403, {"error": "subscription_required", "message": "An active subscription is required."}
+    ),
+    f"{API_PATH}/domain/not-found.test": _json_route(404, {"error": "not_found", "message": "No RDAP data found."}),
+    f"{API_PATH}/domain/not-supported.test": _json_route(
+        404, {"error": "not_supported", "message": "The TLD '.nope' is not supported."}
+    ),
+    f"{API_PATH}/domain/rate-limited.test": _json_route(
+        429, {"error": "rate_limit_exceeded", "message": "Rate limit exceeded."}, {"Retry-After": "60"}
+    ),
+    f"{API_PATH}/domain/temporarily-unavailable.test": _json_route(
+        503,
+        {"error": "temporarily_unavailable", "message": "Data for this domain is temporarily unavailable."},
+        {"Retry-After": "300"},
+    ),
+    f"{API_PATH}/domain/temporarily-unavailable-without-retry-after.test": _json_route(
+        503, {"error": "temporarily_unavailable", "message": "Data for this domain is temporarily unavailable."}
+    ),
+    f"{API_PATH}/domain/invalid-domain.test": _json_route(
+        400, {"error": "invalid_domain", "message": "The provided domain name is not valid."}
+    ),
+    f"{API_PATH}/domain/upstream-failure.test": _json_route(
+        502, {"error": "lookup_failed", "message": "RDAP lookup failed."}
+    ),
+    f"{API_PATH}/domain/html-error.test": (500, httpx.ByteStream(b"Internal Server Error"), {}),
+    f"{API_PATH}/domain/list-error.test": _json_route(502, ["bad gateway"]),
+    f"{API_PATH}/ip/203.0.113.1": _json_route(
+        404, {"error": "not_supported", "message": "No RIR covers this IP range."}
+    ),
+    f"{API_PATH}/tlds/nope": _json_route(
+        404, {"error": "not_found", "message": "No RDAP server is registered for the TLD 'nope'."}
+    ),
+}
+
+
+def dispatch(request: httpx.Request) -> httpx.Response:
+    """Answer ``request`` from ``ROUTES`` for clients built on :class:`httpx.MockTransport`."""
+    status, stream, headers = ROUTES[request.url.path]
+    return httpx.Response(status, stream=stream, headers=headers)
+
+
+# (client method, argument, expected attribute values), served from ROUTES
+LOOKUP_CASES = [
+    pytest.param(
+        "domain",
+        "google.com",
+        {
+            "domain": "google.com",
+            "registrar.name": "MarkMonitor Inc.",
+            "registrar.iana_id": "292",
+            "dates.registered": "1997-09-15T04:00:00Z",
+            "nameservers": ["ns1.google.com", "ns2.google.com"],
+            "dnssec": False,
+            "meta.cached": True,
+        },
+        id="domain",
+    ),
+    pytest.param(
+        "ip",
+        "8.8.8.8",
+        {
+            "handle": "NET-8-8-8-0-2",
+            "name": "GOGL",
+            "cidr": ["8.8.8.0/24"],
+            "ip_version": "v4",
+            "port43": "whois.arin.net",
+        },
+        id="ip",
+    ),
+    pytest.param(
+        "asn",
+        15169,
+        {"handle": "AS15169", "name": "GOOGLE", "start_autnum": 15169},
+        id="asn-int",
+    ),
+    pytest.param("asn", "AS15169", {"handle": "AS15169"}, id="asn-prefixed-string"),
+    pytest.param(
+        "nameserver",
+        "ns1.google.com",
+        {
+            "ldh_name": "ns1.google.com",
+            "ip_addresses.v4": ["216.239.32.10"],
+            "ip_addresses.v6": ["2001:4860:4802:32::a"],
+        },
+        id="nameserver",
+    ),
+    pytest.param(
+        "entity",
+        "GOGL",
+        {
+            "handle": "GOGL",
+            "name": "Google LLC",
+            "entities.abuse.email": "network-abuse@google.com",
+            "autnums.0.handle": "AS15169",
+            "networks.0.cidr": ["8.8.8.0/24"],
+            "public_ids.0.identifier": "GOGL",
+        },
+        id="entity",
+    ),
+]
+
+
+# (client method, argument, follow, value sent in the query string or JSON body)
+FOLLOW_CASES = [
+    pytest.param("domain", "google.com", True, "true", id="domain-follow"),
+    pytest.param("domain", "google.com", False, None, id="domain"),
+    pytest.param("bulk_domains", ["google.com"], True, True, id="bulk-follow"),
+    pytest.param("bulk_domains", ["google.com"], False, None, id="bulk"),
+]
+
+
+# (domain looked up, exception type, expected exception attributes); each domain has an error route in ROUTES
+ERROR_CASES = [
+    pytest.param(
+        "unauthenticated.test",
+        AuthenticationError,
+        {"status_code": 401, "error": "unauthenticated"},
+        id="unauthenticated",
+    ),
+    pytest.param(
+        "subscription-required.test", SubscriptionRequiredError, {"status_code": 403}, id="subscription-required"
+    ),
+    pytest.param("not-found.test", NotFoundError, {"status_code": 404}, id="not-found"),
+    pytest.param(
+        "not-supported.test", NotSupportedError, {"status_code": 404, "error": "not_supported"}, id="not-supported"
+    ),
+    pytest.param("rate-limited.test", RateLimitError, {"status_code": 429, "retry_after": 60}, id="rate-limited"),
+    pytest.param(
+        "temporarily-unavailable.test",
+        TemporarilyUnavailableError,
+        {"status_code": 503, "retry_after": 300},
+        id="temporarily-unavailable",
+    ),
+    pytest.param(
+        "temporarily-unavailable-without-retry-after.test",
+        TemporarilyUnavailableError,
+        {"status_code": 503, "retry_after": None},
+        id="temporarily-unavailable-without-retry-after",
+    ),
+    pytest.param("invalid-domain.test", ValidationError, {"status_code": 400}, id="invalid-domain"),
+    pytest.param("upstream-failure.test", UpstreamError, {"status_code": 502}, id="upstream-failure"),
+]
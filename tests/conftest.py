@@ -0,0 +1,85 @@
+"""Shared fixtures for the client test suites."""
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+
+from rdapapi import AsyncRdapApi, RdapApi
+
+from ._fixtures import BASE_URL, dispatch
+
+
+@pytest.fixture(scope="session")
+def _routes():
+    """Register the commonly mocked endpoints once, by name, on respx's global router.
+
+    Tests set the response they need with ``respx.routes["<name>"].mock(...)``; the
+    per-test ``respx.mock`` context rolls responses and recorded calls back afterwards.
+    """
+    respx.get(f"{BASE_URL}/domain/google.com", name="domain")
+    respx.get(f"{BASE_URL}/ip/8.8.8.8", name="ip")
+    respx.get(f"{BASE_URL}/asn/15169", name="asn")
+    respx.get(f"{BASE_URL}/nameserver/ns1.google.com", name="nameserver")
+    respx.get(f"{BASE_URL}/entity/GOGL", name="entity")
+    respx.post(f"{BASE_URL}/domains/bulk", name="bulk")
+    respx.get(f"{BASE_URL}/tlds", name="tlds")
+    respx.get(f"{BASE_URL}/tlds/com", name="tld")
+    yield respx.routes
+    respx.clear()
+
+
+@pytest.fixture(autouse=True)
+def _respx(_routes):
+    """Mock HTTP for every test through respx's global router; routes are rolled back afterwards."""
+    with respx.mock:
+        yield respx.mock
+
+
+@pytest.fixture(scope="session")
+def api():
+    """A sync client shared by the whole session; caching is off so tests stay independent."""
+    with RdapApi("test-key", base_url=BASE_URL, cache=False) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_api():
+    """An async client shared by the whole session, bound to the session event loop."""
+    async with AsyncRdapApi("test-key", base_url=BASE_URL, cache=False) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def _sent():
+    return []
+
+
+@pytest.fixture
+def sent(_sent):
+    """Requests made through ``mock_api`` or ``async_mock_api`` during the current test."""
+    _sent.clear()
+    return _sent
+
+
+@pytest.fixture(scope="session")
+def _mock_transport(_sent):
+    def handler(request: httpx.Request) -> httpx.Response:
+        _sent.append(request)
+        return dispatch(request)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture(scope="session")
+def mock_api(_mock_transport):
+    """A sync client answering from the canned ``ROUTES`` table; see ``sent`` for the requests it made."""
+    with RdapApi("test-key", base_url=BASE_URL, cache=False, transport=_mock_transport) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_mock_api(_mock_transport):
+    """The async counterpart of ``mock_api``."""
+    async with AsyncRdapApi("test-key", base_url=BASE_URL, cache=False, transport=_mock_transport) as client:
+        yield client
@@ -1,272 +1,89 @@
 """Tests for the asynchronous RDAP API client."""
 
 import httpx
+import orjson
 import pytest
 import respx
 
 from rdapapi import (
     AsyncRdapApi,
-    AuthenticationError,
     NotFoundError,
-    NotSupportedError,
-    RateLimitError,
     SubscriptionRequiredError,
-    TemporarilyUnavailableError,
 )
 from rdapapi.models import BulkDomainResponse, TldListResponse, TldResponse
 
-BASE_URL = "https://rdapapi.io/api/v1"
-
-DOMAIN_RESPONSE = {
-    "domain": "google.com",
-    "unicode_name": None,
-    "handle": "2138514_DOMAIN_COM-VRSN",
-    "status": ["client delete prohibited"],
-    "registrar": {"name": "MarkMonitor Inc.", "iana_id": "292", "abuse_email": None, "abuse_phone": None, "url": None},
-    "dates": {"registered": "1997-09-15T04:00:00Z", "expires": "2028-09-14T04:00:00Z", "updated": None},
-    "nameservers": ["ns1.google.com"],
-    "dnssec": False,
-    "entities": {},
-    "meta": {
-        "rdap_server": "https://rdap.verisign.com/com/v1/",
-        "raw_rdap_url": "https://rdap.verisign.com/com/v1/domain/google.com",
-        "cached": False,
-        "cache_expires": "2026-02-24T15:30:00Z",
-    },
-}
-
-ASN_RESPONSE = {
-    "handle": "AS15169",
-    "name": "GOOGLE",
-    "type": None,
-    "start_autnum": 15169,
-    "end_autnum": 15169,
-    "status": ["active"],
-    "dates": {"registered": "2000-03-30T00:00:00-05:00", "expires": None, "updated": None},
-    "entities": {},
-    "remarks": [],
-    "port43": "whois.arin.net",
-    "meta": {
-        "rdap_server": "https://rdap.arin.net/registry/",
-        "raw_rdap_url": "https://rdap.arin.net/registry/autnum/15169",
-        "cached": False,
-        "cache_expires": "2026-02-24T15:30:00Z",
-    },
-}
-
-
-IP_RESPONSE = {
-    "handle": "NET-8-8-8-0-2",
-    "name": "GOGL",
-    "type": "DIRECT ALLOCATION",
-    "start_address": "8.8.8.0",
-    "end_address": "8.8.8.255",
-    "ip_version": "v4",
-    "parent_handle": "NET-8-0-0-0-0",
-    "country": None,
-    "status": ["active"],
-    "dates": {"registered": "2023-12-28T17:24:33-05:00", "expires": None, "updated": None},
-    "entities": {},
-    "cidr": ["8.8.8.0/24"],
-    "remarks": [],
-    "port43": "whois.arin.net",
-    "meta": {
-        "rdap_server": "https://rdap.arin.net/registry/",
-        "raw_rdap_url": "https://rdap.arin.net/registry/ip/8.8.8.8",
-        "cached": False,
-        "cache_expires": "2026-02-24T15:30:00Z",
-    },
-}
-
-NS_RESPONSE = {
-    "ldh_name": "ns1.google.com",
-    "unicode_name": None,
-    "handle": None,
-    "ip_addresses": {"v4": ["216.239.32.10"], "v6": []},
-    "status": [],
-    "dates": {"registered": None, "expires": None, "updated": None},
-    "entities": {},
-    "meta": {
-        "rdap_server": "https://rdap.verisign.com/com/v1/",
-        "raw_rdap_url": "https://rdap.verisign.com/com/v1/nameserver/ns1.google.com",
-        "cached": False,
-        "cache_expires": "2026-02-24T15:30:00Z",
-    },
-}
-
-ENTITY_RESPONSE = {
-    "handle": "GOGL",
-    "name": "Google LLC",
-    "organization": None,
-    "email": None,
-    "phone": None,
-    "address": None,
-    "contact_url": None,
-    "country_code": None,
-    "roles": [],
-    "status": [],
-    "dates": {"registered": "2000-03-30T00:00:00-04:00", "expires": None, "updated": None},
-    "remarks": [],
-    "port43": "whois.arin.net",
-    "public_ids": [],
-    "entities": {},
-    "autnums": [],
-    "networks": [],
-    "meta": {
-        "rdap_server": "https://rdap.arin.net/registry/",
-        "raw_rdap_url": "https://rdap.arin.net/registry/entity/GOGL",
-        "cached": False,
-        "cache_expires": "2026-02-24T15:30:00Z",
-    },
-}
-
-
-@pytest.mark.asyncio
+from ._fixtures import (
+    BASE_URL,
+    DOMAIN_RESPONSE,
+    DOMAIN_STREAM,
+    ERROR_CASES,
+    FOLLOW_CASES,
+    JSON_HEADERS,
+    LOOKUP_CASES,
+    TLDS_STREAM,
+    resolve,
+)
+
+
 async def test_async_empty_api_key_raises():
     with pytest.raises(ValueError, match="non-empty"):
         AsyncRdapApi("")
 
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_domain_lookup():
-    respx.get(f"{BASE_URL}/domain/google.com").mock(return_value=httpx.Response(200, json=DOMAIN_RESPONSE))
+@pytest.mark.parametrize(("method", "arg", "expected"), LOOKUP_CASES)
+async def test_async_lookup(async_mock_api, method, arg, expected):
+    result = await getattr(async_mock_api, method)(arg)
 
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        result = await api.domain("google.com")
-
-    assert result.domain == "google.com"
-    assert result.registrar.name == "MarkMonitor Inc."
+    assert {attr: resolve(result, attr) for attr in expected} == expected
 
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_domain_with_follow():
-    route = respx.get(f"{BASE_URL}/domain/google.com", params={"follow": "true"}).mock(
-        return_value=httpx.Response(200, json=DOMAIN_RESPONSE)
-    )
+@pytest.mark.parametrize(("method", "arg", "follow", "sent_follow"), FOLLOW_CASES)
+async def test_async_follow_flag(async_mock_api, sent, method, arg, follow, sent_follow):
+    await getattr(async_mock_api, method)(arg, follow=follow)
 
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        await api.domain("google.com", follow=True)
+    (request,) = sent
+    flags = orjson.loads(request.content) if request.method == "POST" else request.url.params
+    assert flags.get("follow") == sent_follow
 
-    assert route.called
 
-
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_asn_lookup():
-    respx.get(f"{BASE_URL}/asn/15169").mock(return_value=httpx.Response(200, json=ASN_RESPONSE))
+async def test_async_lookup_served_from_cache():
+    response = {**DOMAIN_RESPONSE, "meta": {**DOMAIN_RESPONSE["meta"], "cache_expires": "2999-01-01T00:00:00Z"}}
+    route = respx.routes["domain"].mock(return_value=httpx.Response(200, json=response))
 
     async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        result = await api.asn("AS15169")
-
-    assert result.handle == "AS15169"
-    assert result.start_autnum == 15169
-
-
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_authentication_error():
-    respx.get(f"{BASE_URL}/domain/test.com").mock(
-        return_value=httpx.Response(401, json={"error": "unauthenticated", "message": "Invalid token."})
-    )
-
-    async with AsyncRdapApi("bad-key", base_url=BASE_URL) as api:
-        with pytest.raises(AuthenticationError):
-            await api.domain("test.com")
+        first = await api.domain("google.com")
+        assert await api.domain("google.com") is first
 
+    assert route.call_count == 1
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_not_found_error():
-    respx.get(f"{BASE_URL}/domain/nope.example").mock(
-        return_value=httpx.Response(404, json={"error": "not_found", "message": "Not found."})
-    )
 
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        with pytest.raises(NotFoundError):
-            await api.domain("nope.example")
+async def test_async_custom_transport():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/domain/google.com"
+        return httpx.Response(200, stream=DOMAIN_STREAM, headers=JSON_HEADERS)
 
+    transport = httpx.MockTransport(handler)
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_rate_limit_error():
-    respx.get(f"{BASE_URL}/domain/test.com").mock(
-        return_value=httpx.Response(
-            429,
-            json={"error": "rate_limit_exceeded", "message": "Rate limit exceeded."},
-            headers={"Retry-After": "30"},
-        )
-    )
-
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        with pytest.raises(RateLimitError) as exc_info:
-            await api.domain("test.com")
-
-    assert exc_info.value.retry_after == 30
+    async with AsyncRdapApi("test-key", base_url=BASE_URL, transport=transport) as api:
+        result = await api.domain("google.com")
 
+    assert result.domain == "google.com"
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_temporarily_unavailable_error():
-    respx.get(f"{BASE_URL}/domain/test.com").mock(
-        return_value=httpx.Response(
-            503,
-            json={"error": "temporarily_unavailable", "message": "Data for this domain is temporarily unavailable."},
-            headers={"Retry-After": "300"},
-        )
-    )
 
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        with pytest.raises(TemporarilyUnavailableError) as exc_info:
-            await api.domain("test.com")
+@pytest.mark.parametrize(("domain", "exc", "expected"), ERROR_CASES)
+async def test_async_error_response(async_mock_api, domain, exc, expected):
+    with pytest.raises(exc) as exc_info:
+        await async_mock_api.domain(domain)
 
-    assert exc_info.value.retry_after == 300
+    assert type(exc_info.value) is exc
+    assert {attr: getattr(exc_info.value, attr) for attr in expected} == expected
 
 
 # === Async Bulk Domain Lookups ===
 
-BULK_RESPONSE = {
-    "results": [
-        {
-            "domain": "google.com",
-            "status": "success",
-            "data": {
-                "domain": "google.com",
-                "unicode_name": None,
-                "handle": "2138514_DOMAIN_COM-VRSN",
-                "status": ["client delete prohibited"],
-                "registrar": {
-                    "name": "MarkMonitor Inc.",
-                    "iana_id": "292",
-                    "abuse_email": None,
-                    "abuse_phone": None,
-                    "url": None,
-                },
-                "dates": {"registered": "1997-09-15T04:00:00Z", "expires": "2028-09-14T04:00:00Z", "updated": None},
-                "nameservers": ["ns1.google.com"],
-                "dnssec": False,
-                "entities": {},
-            },
-            "meta": {
-                "rdap_server": "https://rdap.verisign.com/com/v1/",
-                "raw_rdap_url": "https://rdap.verisign.com/com/v1/domain/google.com",
-                "cached": False,
-                "cache_expires": "2026-02-25T15:30:00Z",
-            },
-        },
-    ],
-    "summary": {"total": 1, "successful": 1, "failed": 0},
-}
-
-
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_bulk_domains_lookup():
-    respx.post(f"{BASE_URL}/domains/bulk").mock(return_value=httpx.Response(200, json=BULK_RESPONSE))
 
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        result = await api.bulk_domains(["google.com"])
+async def test_async_bulk_domains_lookup(async_mock_api):
+    result = await async_mock_api.bulk_domains(["google.com"])
 
     assert isinstance(result, BulkDomainResponse)
     assert result.summary.successful == 1
@@ -274,182 +91,60 @@ async def test_async_bulk_domains_lookup():
     assert result.results[0].data.domain == "google.com"
 
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_bulk_domains_plan_upgrade_required():
-    respx.post(f"{BASE_URL}/domains/bulk").mock(
+async def test_async_bulk_domains_plan_upgrade_required(async_api):
+    respx.routes["bulk"].mock(
         return_value=httpx.Response(
             403, json={"error": "plan_upgrade_required", "message": "Bulk lookups require a Pro or Business plan."}
         )
     )
 
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        with pytest.raises(SubscriptionRequiredError) as exc_info:
-            await api.bulk_domains(["google.com"])
+    with pytest.raises(SubscriptionRequiredError) as exc_info:
+        await async_api.bulk_domains(["google.com"])
 
     assert exc_info.value.error == "plan_upgrade_required"
 
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_ip_lookup():
-    respx.get(f"{BASE_URL}/ip/8.8.8.8").mock(return_value=httpx.Response(200, json=IP_RESPONSE))
-
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        result = await api.ip("8.8.8.8")
+# === Async TLDs ===
 
-    assert result.handle == "NET-8-8-8-0-2"
-    assert result.ip_version == "v4"
 
-
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_nameserver_lookup():
-    respx.get(f"{BASE_URL}/nameserver/ns1.google.com").mock(return_value=httpx.Response(200, json=NS_RESPONSE))
-
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        result = await api.nameserver("ns1.google.com")
-
-    assert result.ldh_name == "ns1.google.com"
-
-
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_entity_lookup():
-    respx.get(f"{BASE_URL}/entity/GOGL").mock(return_value=httpx.Response(200, json=ENTITY_RESPONSE))
-
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        result = await api.entity("GOGL")
-
-    assert result.handle == "GOGL"
-    assert result.name == "Google LLC"
-
-
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_bulk_domains_with_follow():
-    import json
-
-    route = respx.post(f"{BASE_URL}/domains/bulk").mock(return_value=httpx.Response(200, json=BULK_RESPONSE))
-
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        await api.bulk_domains(["google.com"], follow=True)
-
-    body = json.loads(route.calls[0].request.content)
-    assert body["follow"] is True
-
-
-# === Async TLDs + NotSupportedError ===
-
-TLDS_RESPONSE = {
-    "data": [
-        {
-            "tld": "com",
-            "supported_since": "2026-03-07T00:00:00Z",
-            "rdap_server_host": "rdap.verisign.com",
-            "rdap_server_url": "https://rdap.verisign.com/com/v1/",
-            "field_availability": {
-                "registrar": "sometimes",
-                "registered_at": "always",
-                "expires_at": "always",
-                "nameservers": "always",
-                "status": "always",
-            },
-        },
-    ],
-    "meta": {
-        "computed_at": "2026-04-22T10:00:00Z",
-        "count": 1,
-        "coverage": 1.0,
-        "thresholds": {"always": 0.99, "usually": 0.8, "sometimes": 0.0},
-    },
-}
-
-TLD_RESPONSE = {
-    "data": {
-        "tld": "com",
-        "supported_since": "2026-03-07T00:00:00Z",
-        "rdap_server_host": "rdap.verisign.com",
-        "rdap_server_url": "https://rdap.verisign.com/com/v1/",
-        "field_availability": None,
-    },
-    "meta": {
-        "computed_at": "2026-04-22T10:00:00Z",
-        "thresholds": {"always": 0.99, "usually": 0.8, "sometimes": 0.0},
-    },
-}
-
-
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_not_supported_error():
-    respx.get(f"{BASE_URL}/domain/example.nope").mock(
-        return_value=httpx.Response(
-            404, json={"error": "not_supported", "message": "The TLD '.nope' is not supported."}
-        )
-    )
-
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        with pytest.raises(NotSupportedError) as exc_info:
-            await api.domain("example.nope")
-
-    assert isinstance(exc_info.value, NotFoundError)
-
-
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_tlds_list():
-    respx.get(f"{BASE_URL}/tlds").mock(return_value=httpx.Response(200, json=TLDS_RESPONSE, headers={"ETag": '"abc"'}))
-
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        result = await api.tlds()
+async def test_async_tlds_list(async_mock_api):
+    result = await async_mock_api.tlds()
 
     assert isinstance(result, TldListResponse)
     assert result.data[0].tld == "com"
     assert result.etag == '"abc"'
 
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_tlds_list_with_filters():
-    route = respx.get(f"{BASE_URL}/tlds").mock(return_value=httpx.Response(200, json=TLDS_RESPONSE))
+async def test_async_tlds_list_with_filters(async_api):
+    route = respx.routes["tlds"].mock(return_value=httpx.Response(200, stream=TLDS_STREAM, headers=JSON_HEADERS))
 
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        await api.tlds(since="2026-04-01T00:00:00Z", server="rdap.verisign.com")
+    await async_api.tlds(since="2026-04-01T00:00:00Z", server="rdap.verisign.com")
 
     request = route.calls[0].request
     assert request.url.params["since"] == "2026-04-01T00:00:00Z"
     assert request.url.params["server"] == "rdap.verisign.com"
 
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_tlds_list_304_returns_none():
-    respx.get(f"{BASE_URL}/tlds").mock(return_value=httpx.Response(304))
-
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        assert await api.tlds(if_none_match='"abc"') is None
+async def test_async_tlds_list_304_returns_none(async_api):
+    respx.routes["tlds"].mock(return_value=httpx.Response(304))
 
+    assert await async_api.tlds(if_none_match='"abc"') is None
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_tld_show():
-    respx.get(f"{BASE_URL}/tlds/com").mock(
-        return_value=httpx.Response(200, json=TLD_RESPONSE, headers={"ETag": '"com-1"'})
-    )
 
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        result = await api.tld("com")
+async def test_async_tld_show(async_mock_api):
+    result = await async_mock_api.tld("com")
 
     assert isinstance(result, TldResponse)
     assert result.data.tld == "com"
     assert result.etag == '"com-1"'
 
 
-@pytest.mark.asyncio
-@respx.mock
-async def test_async_tld_show_304_returns_none():
-    respx.get(f"{BASE_URL}/tlds/com").mock(return_value=httpx.Response(304))
+async def test_async_tld_show_304_returns_none(async_api):
+    respx.routes["tld"].mock(return_value=httpx.Response(304))
 
-    async with AsyncRdapApi("test-key", base_url=BASE_URL) as api:
-        assert await api.tld("com", if_none_match='"com-1"') is None
+    assert await async_api.tld("com", if_none_match='"com-1"') is None
+
+
+async def test_async_tld_show_not_found(async_mock_api):
+    with pytest.raises(NotFoundError):
+        await async_mock_api.tld("nope")
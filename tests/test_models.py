@@ -1,5 +1,13 @@
 """Tests for Pydantic model parsing."""
 
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
 from rdapapi import (
     AsnResponse,
     BulkDomainResponse,
@@ -9,10 +17,25 @@ from rdapapi import (
     IpResponse,
     NameserverResponse,
 )
+from rdapapi.models import Contact, EntityAutnum, EntityNetwork, PublicId
+
+from ._fixtures import resolve
+
+
+def _frozen(value: Any) -> Any:
+    """Wrap every dict in ``value`` in a read-only view so shared payloads cannot be mutated by a test."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _frozen(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_frozen(item) for item in value]
+    return value
 
 
-def test_domain_response_parses():
-    data = {
+# Prototype for payloads without dates; vary it with ``{**_NO_DATES, "expires": ...}``.
+_NO_DATES = _frozen({"registered": None, "expires": None, "updated": None})
+
+_DOMAIN_DATA = _frozen(
+    {
         "domain": "example.com",
         "unicode_name": None,
         "handle": "EXAMPLE-HANDLE",
@@ -46,26 +69,16 @@ def test_domain_response_parses():
             "cache_expires": "2026-02-25T00:00:00Z",
         },
     }
+)
 
-    result = DomainResponse.model_validate(data)
-
-    assert result.domain == "example.com"
-    assert result.dnssec is True
-    assert result.entities.registrant is not None
-    assert result.entities.registrant.name == "John Doe"
-    assert result.entities.registrant.country_code == "US"
-    assert result.entities.administrative is None
-    assert result.meta.rdap_server == "https://rdap.example.com/"
-
-
-def test_domain_response_empty_entities():
-    data = {
+_EMPTY_DOMAIN_DATA = _frozen(
+    {
         "domain": "test.com",
         "unicode_name": None,
         "handle": None,
         "status": [],
         "registrar": {"name": None, "iana_id": None, "abuse_email": None, "abuse_phone": None, "url": None},
-        "dates": {"registered": None, "expires": None, "updated": None},
+        "dates": _NO_DATES,
         "nameservers": [],
         "dnssec": False,
         "entities": {},
@@ -76,17 +89,10 @@ def test_domain_response_empty_entities():
             "cache_expires": "2026-02-25T00:00:00Z",
         },
     }
+)
 
-    result = DomainResponse.model_validate(data)
-
-    assert result.entities.registrant is None
-    assert result.entities.technical is None
-    assert result.handle is None
-    assert result.dates.registered is None
-
-
-def test_ip_response_parses():
-    data = {
+_IP_DATA = _frozen(
+    {
         "handle": "NET-1-0-0-0-1",
         "name": "TEST-NET",
         "type": "DIRECT ALLOCATION",
@@ -108,16 +114,10 @@ def test_ip_response_parses():
             "cache_expires": "2026-02-25T00:00:00Z",
         },
     }
+)
 
-    result = IpResponse.model_validate(data)
-
-    assert result.cidr == ["1.0.0.0/24"]
-    assert result.country == "AU"
-    assert result.remarks[0].description == "Test network"
-
-
-def test_asn_response_parses():
-    data = {
+_ASN_DATA = _frozen(
+    {
         "handle": "AS15169",
         "name": "GOOGLE",
         "type": None,
@@ -135,22 +135,16 @@ def test_asn_response_parses():
             "cache_expires": "2026-02-25T00:00:00Z",
         },
     }
+)
 
-    result = AsnResponse.model_validate(data)
-
-    assert result.start_autnum == 15169
-    assert result.end_autnum == 15169
-    assert result.type is None
-
-
-def test_nameserver_response_parses():
-    data = {
+_NS_DATA = _frozen(
+    {
         "ldh_name": "ns1.google.com",
         "unicode_name": None,
         "handle": None,
         "ip_addresses": {"v4": ["216.239.32.10"], "v6": ["2001:4860:4802:32::a"]},
         "status": [],
-        "dates": {"registered": None, "expires": None, "updated": None},
+        "dates": _NO_DATES,
         "entities": {},
         "meta": {
             "rdap_server": "https://rdap.verisign.com/com/v1/",
@@ -159,16 +153,10 @@ def test_nameserver_response_parses():
             "cache_expires": "2026-02-25T00:00:00Z",
         },
     }
+)
 
-    result = NameserverResponse.model_validate(data)
-
-    assert result.ldh_name == "ns1.google.com"
-    assert result.ip_addresses.v4 == ["216.239.32.10"]
-    assert result.handle is None
-
-
-def test_entity_response_with_autnums_and_networks():
-    data = {
+_ENTITY_DATA = _frozen(
+    {
         "handle": "GOGL",
         "name": "Google LLC",
         "organization": None,
@@ -216,80 +204,10 @@ def test_entity_response_with_autnums_and_networks():
             "cache_expires": "2026-02-25T00:00:00Z",
         },
     }
+)
 
-    result = EntityResponse.model_validate(data)
-
-    assert result.handle == "GOGL"
-    assert result.name == "Google LLC"
-    assert result.entities.abuse is not None
-    assert result.entities.abuse.email == "network-abuse@google.com"
-    assert len(result.autnums) == 2
-    assert result.autnums[0].handle == "AS15169"
-    assert result.autnums[1].name == "YOUTUBE"
-    assert result.networks[0].cidr == ["8.8.8.0/24"]
-    assert result.public_ids[0].type == "ARIN OrgID"
-
-
-def test_model_dump_roundtrip():
-    data = {
-        "handle": "AS15169",
-        "name": "GOOGLE",
-        "type": None,
-        "start_autnum": 15169,
-        "end_autnum": 15169,
-        "status": ["active"],
-        "dates": {"registered": "2000-03-30T00:00:00Z", "expires": None, "updated": None},
-        "entities": {},
-        "remarks": [],
-        "port43": "whois.arin.net",
-        "meta": {
-            "rdap_server": "https://rdap.arin.net/registry/",
-            "raw_rdap_url": "https://rdap.arin.net/registry/autnum/15169",
-            "cached": False,
-            "cache_expires": "2026-02-25T00:00:00Z",
-        },
-    }
-
-    original = AsnResponse.model_validate(data)
-    dumped = original.model_dump()
-    restored = AsnResponse.model_validate(dumped)
-
-    assert original == restored
-    assert restored.handle == "AS15169"
-
-
-def test_dates_parsed_properties():
-    from datetime import datetime, timezone
-
-    dates = Dates.model_validate(
-        {"registered": "2020-01-01T00:00:00Z", "expires": "2028-09-14T04:00:00Z", "updated": None}
-    )
-
-    assert dates.registered_at == datetime(2020, 1, 1, tzinfo=timezone.utc)
-    assert dates.expires_at == datetime(2028, 9, 14, 4, 0, 0, tzinfo=timezone.utc)
-    assert dates.updated_at is None
-    assert isinstance(dates.expires_in_days, int)
-    assert dates.expires_in_days > 0
-
-
-def test_dates_null_returns_none():
-    dates = Dates.model_validate({"registered": None, "expires": None, "updated": None})
-
-    assert dates.registered_at is None
-    assert dates.expires_at is None
-    assert dates.updated_at is None
-    assert dates.expires_in_days is None
-
-
-def test_dates_invalid_string_returns_none():
-    dates = Dates.model_validate({"registered": "not-a-date", "expires": "garbage", "updated": None})
-
-    assert dates.registered_at is None
-    assert dates.expires_at is None
-
-
-def test_bulk_domain_response_parses():
-    data = {
+_BULK_DATA = _frozen(
+    {
         "results": [
             {
                 "domain": "google.com",
@@ -327,16 +245,187 @@ def test_bulk_domain_response_parses():
         ],
         "summary": {"total": 2, "successful": 1, "failed": 1},
     }
+)
+
+
+# Encoded once, the way the client receives them, for model_validate_json; ``default`` unwraps the read-only views.
+_DOMAIN_JSON = orjson.dumps(_DOMAIN_DATA, default=dict)
+_EMPTY_DOMAIN_JSON = orjson.dumps(_EMPTY_DOMAIN_DATA, default=dict)
+_IP_JSON = orjson.dumps(_IP_DATA, default=dict)
+_ASN_JSON = orjson.dumps(_ASN_DATA, default=dict)
+_NS_JSON = orjson.dumps(_NS_DATA, default=dict)
+_ENTITY_JSON = orjson.dumps(_ENTITY_DATA, default=dict)
+_BULK_JSON = orjson.dumps(_BULK_DATA, default=dict)
+
+# Validated once and shared by tests that only read from it; copy before mutating.
+_ASN_RESULT = AsnResponse.model_validate(_ASN_DATA)
+
+# The entity payload as dumped back out, with the optional fields it leaves out filled in as None.
+_EXPECTED_ENTITY_DUMP = {
+    **_ENTITY_DATA,
+    "entities": {
+        "registrant": None,
+        "administrative": None,
+        "technical": None,
+        "billing": None,
+        "abuse": _ENTITY_DATA["entities"]["abuse"],
+    },
+    "meta": {**_ENTITY_DATA["meta"], "followed": None, "registrar_rdap_server": None, "follow_error": None},
+}
+
+# (model, JSON payload, expected attribute values)
+_PARSE_CASES = [
+    pytest.param(
+        DomainResponse,
+        _DOMAIN_JSON,
+        {
+            "domain": "example.com",
+            "dnssec": True,
+            "entities.registrant.name": "John Doe",
+            "entities.registrant.country_code": "US",
+            "entities.administrative": None,
+            "meta.rdap_server": "https://rdap.example.com/",
+        },
+        id="domain",
+    ),
+    pytest.param(
+        DomainResponse,
+        _EMPTY_DOMAIN_JSON,
+        {"entities.registrant": None, "entities.technical": None, "handle": None, "dates.registered": None},
+        id="domain-empty-entities",
+    ),
+    pytest.param(
+        IpResponse,
+        _IP_JSON,
+        {"cidr": ["1.0.0.0/24"], "country": "AU", "remarks.0.description": "Test network"},
+        id="ip",
+    ),
+    pytest.param(AsnResponse, _ASN_JSON, {"start_autnum": 15169, "end_autnum": 15169, "type": None}, id="asn"),
+    pytest.param(
+        NameserverResponse,
+        _NS_JSON,
+        {"ldh_name": "ns1.google.com", "ip_addresses.v4": ["216.239.32.10"], "handle": None},
+        id="nameserver",
+    ),
+    pytest.param(
+        BulkDomainResponse,
+        _BULK_JSON,
+        {
+            "summary.total": 2,
+            "summary.successful": 1,
+            "summary.failed": 1,
+            "results.0.status": "success",
+            "results.0.data.registrar.name": "MarkMonitor Inc.",
+            "results.0.data.meta.cached": False,
+            "results.1.status": "error",
+            "results.1.error": "invalid_domain",
+            "results.1.data": None,
+        },
+        id="bulk",
+    ),
+]
+
+
+@pytest.mark.parametrize(("model", "payload", "expected"), _PARSE_CASES)
+def test_response_parses(model, payload, expected):
+    result = model.model_validate_json(payload)
+
+    assert {attr: resolve(result, attr) for attr in expected} == expected
+
+
+def test_entity_response_with_autnums_and_networks():
+    result = EntityResponse.model_validate_json(_ENTITY_JSON)
+
+    assert isinstance(result.entities.abuse, Contact)
+    assert isinstance(result.autnums[1], EntityAutnum)
+    assert isinstance(result.networks[0], EntityNetwork)
+    assert isinstance(result.public_ids[0], PublicId)
+    assert result.model_dump() == _EXPECTED_ENTITY_DUMP
+
+
+def test_model_copy_roundtrip():
+    restored = _ASN_RESULT.model_copy(deep=True)
+
+    assert restored == _ASN_RESULT
+    assert restored.dates is not _ASN_RESULT.dates
+
+
+def test_model_dump_json_roundtrip():
+    restored = AsnResponse.model_validate_json(_ASN_RESULT.model_dump_json())
+
+    assert restored == _ASN_RESULT
+    assert restored.handle == "AS15169"
+
+
+def test_models_are_frozen():
+    with pytest.raises(ValidationError, match="frozen"):
+        _ASN_RESULT.handle = "AS1"
+
+
+def test_dates_parsed_properties():
+    dates = Dates.model_validate({**_NO_DATES, "registered": "2020-01-01T00:00:00Z", "expires": "2028-09-14T04:00:00Z"})
+
+    assert dates.registered_at == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert dates.expires_at == datetime(2028, 9, 14, 4, 0, 0, tzinfo=timezone.utc)
+    assert dates.updated_at is None
+    assert isinstance(dates.expires_in_days, int)
+    assert dates.expires_in_days > 0
+
+
+def test_dates_parsed_once_and_reparsed_on_copy():
+    dates = Dates.model_validate({**_NO_DATES, "expires": "2028-09-14T04:00:00Z"})
+
+    assert dates.expires_at is dates.expires_at
+
+    copied = dates.model_copy(update={"expires": "2030-01-01T00:00:00Z"})
+
+    assert copied.expires_at.year == 2030
+    assert dates.expires_at.year == 2028
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2023-12-28T17:24:33-05:00", datetime(2023, 12, 28, 17, 24, 33, tzinfo=timezone(timedelta(hours=-5)))),
+        ("2020-01-01T00:00:00.123Z", datetime(2020, 1, 1, 0, 0, 0, 123000, tzinfo=timezone.utc)),
+        ("2020-01-01T00:00:00.123456Z", datetime(2020, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc)),
+        ("2020-01-01T00:00:00", datetime(2020, 1, 1, tzinfo=timezone.utc)),
+        ("2020-01-01", datetime(2020, 1, 1, tzinfo=timezone.utc)),
+    ],
+)
+def test_dates_parse_other_iso_forms(value, expected):
+    assert Dates(registered=value).registered_at == expected
+
+
+def test_dates_null_returns_none():
+    dates = Dates.model_validate(_NO_DATES)
+
+    assert dates.registered_at is None
+    assert dates.expires_at is None
+    assert dates.updated_at is None
+    assert dates.expires_in_days is None
+
+
+def test_dates_invalid_string_returns_none():
+    dates = Dates.model_validate(
+        {"registered": "not-a-rdap-datetimeZ", "expires": "garbage", "updated": "2020-13-01T00:00:00Z"}
+    )
+
+    assert dates.registered_at is None
+    assert dates.expires_at is None
+    assert dates.updated_at is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["20200101T000000.000Z", "2020-W01-1T00:00:00Z", "2020-01-01T00:00:00.1234Z"],
+    ids=["basic", "week-date", "four-digit-fraction"],
+)
+def test_dates_forms_only_newer_pythons_parse_return_none(value):
+    assert Dates(registered=value).registered_at is None
+
+
+def test_dates_without_offset_count_days_in_utc():
+    dates = Dates(expires=(datetime.now(timezone.utc) + timedelta(days=10, hours=1)).strftime("%Y-%m-%dT%H:%M:%S"))
 
-    result = BulkDomainResponse.model_validate(data)
-
-    assert result.summary.total == 2
-    assert result.summary.successful == 1
-    assert result.summary.failed == 1
-    assert result.results[0].status == "success"
-    assert result.results[0].data is not None
-    assert result.results[0].data.registrar.name == "MarkMonitor Inc."
-    assert result.results[0].data.meta.cached is False
-    assert result.results[1].status == "error"
-    assert result.results[1].error == "invalid_domain"
-    assert result.results[1].data is None
+    assert dates.expires_in_days == 10